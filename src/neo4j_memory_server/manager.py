@@ -1,291 +1,725 @@
+import re
+from functools import lru_cache
 from typing import Any, Dict, List
 
-from neo4j import GraphDatabase, basic_auth
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    RoutingControl,
+    basic_auth,
+)
+from neo4j.exceptions import ClientError
 
 from neo4j_memory_server.models import Relation, Entity, KnowledgeGraph
 
+_RELATION_TYPE_PATTERN = re.compile(r'[A-Z_][A-Z0-9_]*')
+
+# Characters and operators the Lucene query parser treats as syntax
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
+
+# Above this row count, batched writes are split into inner transactions
+# to keep lock hold times and page-cache pressure bounded
+_BATCH_TX_ROWS = 1000
+
+# Cypher lives in module-level constants: Neo4j's plan cache is keyed on
+# the exact query string, so reusing identical bytes per call guarantees
+# cache hits and skips re-parse/re-plan
+
+_Q_CREATE_ENTITIES = """
+UNWIND $rows AS row
+CREATE (e:Entity {
+    name: row.name,
+    entity_type: row.entity_type,
+    observations: row.observations,
+    name_lc: toLower(row.name),
+    entity_type_lc: toLower(row.entity_type),
+    observations_lc: [x IN row.observations | toLower(x)]
+})
+"""
+
+_Q_CREATE_ENTITIES_CHUNKED = f"""
+UNWIND $rows AS row
+CALL {{
+    WITH row
+    CREATE (e:Entity {{
+        name: row.name,
+        entity_type: row.entity_type,
+        observations: row.observations,
+        name_lc: toLower(row.name),
+        entity_type_lc: toLower(row.entity_type),
+        observations_lc: [x IN row.observations | toLower(x)]
+    }})
+}} IN TRANSACTIONS OF {_BATCH_TX_ROWS} ROWS
+"""
+
+_Q_MERGE_RELATIONS = """
+UNWIND $rows AS row
+MATCH (from:Entity {name: row.from})
+MATCH (to:Entity {name: row.to})
+CALL apoc.merge.relationship(from, row.rt, {}, {_new: true}, to, {}) YIELD rel
+WITH rel, row, coalesce(rel._new, false) AS created
+REMOVE rel._new
+RETURN row.from AS from_name, row.to AS to_name, row.rt AS relation_type, created
+"""
+
+_Q_MISSING_ENTITIES = """
+UNWIND $names AS name
+OPTIONAL MATCH (e:Entity {name: name})
+WITH name WHERE e IS NULL
+RETURN collect(name) AS missing
+"""
+
+_Q_ADD_OBSERVATIONS = """
+UNWIND $items AS it
+MATCH (e:Entity {name: it.name})
+WITH e, it, [c IN it.contents WHERE NOT c IN coalesce(e.observations, [])] AS added
+SET e.observations = coalesce(e.observations, []) + added
+SET e.observations_lc = [x IN e.observations | toLower(x)]
+RETURN it.name AS name, added
+"""
+
+_Q_ADD_OBSERVATIONS_CHUNKED = f"""
+UNWIND $items AS it
+CALL {{
+    WITH it
+    MATCH (e:Entity {{name: it.name}})
+    WITH e, it, [c IN it.contents WHERE NOT c IN coalesce(e.observations, [])] AS added
+    SET e.observations = coalesce(e.observations, []) + added
+    SET e.observations_lc = [x IN e.observations | toLower(x)]
+    RETURN added
+}} IN TRANSACTIONS OF {_BATCH_TX_ROWS} ROWS
+RETURN it.name AS name, added
+"""
+
+_Q_DELETE_ENTITIES = """
+MATCH (e:Entity) WHERE e.name IN $entity_names DETACH DELETE e
+"""
+
+_Q_DELETE_OBSERVATIONS = """
+UNWIND $items AS it
+MATCH (e:Entity {name: it.name})
+SET e.observations = [o IN coalesce(e.observations, []) WHERE NOT o IN it.obs]
+SET e.observations_lc = [x IN e.observations | toLower(x)]
+"""
+
+_Q_DELETE_RELATIONS = """
+UNWIND $rows AS row
+MATCH (from:Entity {name: row.from})-[r]->(to:Entity {name: row.to})
+WHERE type(r) = row.rt
+DELETE r
+"""
+
+_Q_READ_GRAPH = """
+MATCH (e:Entity)
+WITH collect({name: e.name, entity_type: e.entity_type, observations: e.observations}) AS ents
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+RETURN ents,
+       [rel IN collect({from_name: from.name, to_name: to.name, relation_type: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relation_type IS NOT NULL] AS rels
+"""
+
+_Q_READ_GRAPH_RAW = """
+MATCH (e:Entity)
+WITH collect({name: e.name, entityType: e.entity_type, observations: coalesce(e.observations, [])}) AS ents
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+RETURN ents,
+       [rel IN collect({from: from.name, to: to.name, relationType: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relationType IS NOT NULL] AS rels
+"""
+
+_Q_SEARCH_NODES = """
+CALL db.index.fulltext.queryNodes('entity_search', $search_query) YIELD node AS e
+WITH collect({name: e.name, entity_type: e.entity_type, observations: e.observations}) AS ents,
+     collect(e.name) AS names
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN names AND to.name IN names
+RETURN ents,
+       [rel IN collect({from_name: from.name, to_name: to.name, relation_type: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relation_type IS NOT NULL] AS rels
+"""
+
+_Q_SEARCH_NODES_RAW = """
+CALL db.index.fulltext.queryNodes('entity_search', $search_query) YIELD node AS e
+WITH collect({name: e.name, entityType: e.entity_type, observations: coalesce(e.observations, [])}) AS ents,
+     collect(e.name) AS names
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN names AND to.name IN names
+RETURN ents,
+       [rel IN collect({from: from.name, to: to.name, relationType: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relationType IS NOT NULL] AS rels
+"""
+
+_Q_SEARCH_NODES_SUBSTRING = """
+MATCH (e:Entity)
+WHERE e.name_lc CONTAINS $search_query_lc
+   OR e.entity_type_lc CONTAINS $search_query_lc
+   OR any(obs IN coalesce(e.observations_lc, []) WHERE obs CONTAINS $search_query_lc)
+WITH collect({name: e.name, entity_type: e.entity_type, observations: e.observations}) AS ents,
+     collect(e.name) AS names
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN names AND to.name IN names
+RETURN ents,
+       [rel IN collect({from_name: from.name, to_name: to.name, relation_type: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relation_type IS NOT NULL] AS rels
+"""
+
+_Q_SEARCH_NODES_SUBSTRING_RAW = """
+MATCH (e:Entity)
+WHERE e.name_lc CONTAINS $search_query_lc
+   OR e.entity_type_lc CONTAINS $search_query_lc
+   OR any(obs IN coalesce(e.observations_lc, []) WHERE obs CONTAINS $search_query_lc)
+WITH collect({name: e.name, entityType: e.entity_type, observations: coalesce(e.observations, [])}) AS ents,
+     collect(e.name) AS names
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN names AND to.name IN names
+RETURN ents,
+       [rel IN collect({from: from.name, to: to.name, relationType: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relationType IS NOT NULL] AS rels
+"""
+
+_Q_OPEN_NODES = """
+MATCH (e:Entity)
+WHERE e.name IN $entity_names
+WITH collect({name: e.name, entity_type: e.entity_type, observations: e.observations}) AS ents,
+     collect(e.name) AS found
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN found AND to.name IN found
+RETURN ents,
+       [rel IN collect({from_name: from.name, to_name: to.name, relation_type: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relation_type IS NOT NULL] AS rels
+"""
+
+_Q_OPEN_NODES_RAW = """
+MATCH (e:Entity)
+WHERE e.name IN $entity_names
+WITH collect({name: e.name, entityType: e.entity_type, observations: coalesce(e.observations, [])}) AS ents,
+     collect(e.name) AS found
+OPTIONAL MATCH (from:Entity)-[r]->(to:Entity)
+WHERE from.name IN found AND to.name IN found
+RETURN ents,
+       [rel IN collect({from: from.name, to: to.name, relationType: toLower(replace(type(r), '_', ' '))})
+        WHERE rel.relationType IS NOT NULL] AS rels
+"""
+
+
+def _escape_lucene_query(query: str) -> str:
+    """Escape Lucene query syntax so user input is matched literally.
+
+    Bare boolean keywords (a query of just "AND") still fail to parse;
+    the caller handles that by catching the resulting ClientError.
+    """
+    return _LUCENE_SPECIAL.sub(r'\\\1', query)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_relation_type(relation_type: str) -> str:
+    """Normalize a relation type for use as a Cypher relationship type.
+
+    The result is interpolated into query strings, so reject anything
+    that does not look like a plain relationship-type identifier.
+    Memoized since relation types come from a small vocabulary.
+    """
+    normalized = relation_type.upper().replace(' ', '_')
+    if not _RELATION_TYPE_PATTERN.fullmatch(normalized):
+        raise ValueError(f"Invalid relation type: {relation_type}")
+    return normalized
 
-class Neo4jKnowledgeGraphManager:
-    """Manages knowledge graph operations using Neo4j as the backend."""
 
-    def __init__(self, uri: str, username: str, password: str, database: str = "neo4j"):
-        self.driver = GraphDatabase.driver(uri, auth=basic_auth(username, password))
+class Neo4jKnowledgeGraphManager:
+    """Manages knowledge graph operations using Neo4j as the backend.
+
+    The manager owns a single Driver (and its connection pool) for the
+    lifetime of the process; construct it once and reuse it rather than
+    creating one per call.
+    """
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        database: str = "neo4j",
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        connection_timeout: float = 30.0,
+        driver: AsyncDriver | None = None,
+    ):
+        if driver is not None:
+            # Reuse an externally managed driver (and its connection pool)
+            # instead of constructing a second one
+            self.driver = driver
+        else:
+            self.driver = AsyncGraphDatabase.driver(
+                uri,
+                auth=basic_auth(username, password),
+                max_connection_pool_size=max_connection_pool_size,
+                connection_acquisition_timeout=connection_acquisition_timeout,
+                connection_timeout=connection_timeout,
+            )
         self.database = database
-        self._ensure_constraints()
-
-    def _ensure_constraints(self):
+        # read_graph memoization: every write bumps _write_seq, and a
+        # cached graph is only served while the counter is unchanged.
+        # Assumes this manager is the process's only writer
+        self._write_seq = 0
+        self._read_graph_cache: KnowledgeGraph | None = None
+        self._read_graph_cache_seq = -1
+
+    @classmethod
+    async def create(
+        cls,
+        uri: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        database: str = "neo4j",
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        connection_timeout: float = 30.0,
+        driver: AsyncDriver | None = None,
+    ) -> "Neo4jKnowledgeGraphManager":
+        """Create a manager and set up constraints (async factory)."""
+        manager = cls(
+            uri=uri,
+            username=username,
+            password=password,
+            database=database,
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+            connection_timeout=connection_timeout,
+            driver=driver,
+        )
+        await manager._ensure_constraints()
+        return manager
+
+    def _session(self, **kwargs: Any) -> AsyncSession:
+        """Open a session on the shared driver (overridable in tests)."""
+        return self.driver.session(database=self.database, **kwargs)
+
+    async def _ensure_constraints(self) -> None:
         """Create necessary constraints and indexes."""
-        with self.driver.session(database=self.database) as session:
+        async with self._session() as session:
             # Create unique constraint on entity name
             try:
-                session.run(
+                await session.run(
                     "CREATE CONSTRAINT entity_name_unique IF NOT EXISTS FOR (e:Entity) REQUIRE e.name IS UNIQUE")
             except Exception:
                 pass  # Constraint might already exist
 
-    def close(self):
+            # Full-text index backing search_nodes
+            try:
+                await session.run(
+                    "CREATE FULLTEXT INDEX entity_search IF NOT EXISTS "
+                    "FOR (e:Entity) ON EACH [e.name, e.entity_type, e.observations]")
+            except Exception:
+                pass  # Index might already exist
+
+            # Text index over the precomputed lowercase name for
+            # substring searches
+            try:
+                await session.run(
+                    "CREATE TEXT INDEX entity_name_lc_idx IF NOT EXISTS FOR (e:Entity) ON (e.name_lc)")
+            except Exception:
+                pass  # Index might already exist
+
+            # Range index for exact entity_type lookups
+            try:
+                await session.run(
+                    "CREATE INDEX entity_type_idx IF NOT EXISTS FOR (e:Entity) ON (e.entity_type)")
+            except Exception:
+                pass  # Index might already exist
+
+            # Backfill the lowercase shadow properties on entities created
+            # before they existed; without this, substring search silently
+            # skips all pre-upgrade data. No-op once everything is migrated
+            try:
+                result = await session.run(
+                    "MATCH (e:Entity) WHERE e.name_lc IS NULL "
+                    "SET e.name_lc = toLower(e.name), "
+                    "    e.entity_type_lc = toLower(e.entity_type), "
+                    "    e.observations_lc = [x IN coalesce(e.observations, []) | toLower(x)]")
+                await result.consume()
+            except Exception:
+                pass  # Non-fatal: retried on the next startup
+
+    async def close(self) -> None:
         """Close the Neo4j driver connection."""
         if self.driver:
-            self.driver.close()
+            await self.driver.close()
 
     async def create_entities(self, entities: List[Entity]) -> List[Entity]:
         """Create new entities in the knowledge graph."""
+        # Cheap read-routed prefilter: most workloads resubmit entities
+        # that already exist, and a read takes no write locks and can run
+        # on a replica. MERGE would lock every row instead
+        records, _, _ = await self.driver.execute_query(
+            _Q_MISSING_ENTITIES,
+            names=[entity.name for entity in entities],
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        missing = set(records[0]['missing'])
+        if not missing:
+            return []
+
         new_entities = []
+        rows = []
+        for entity in entities:
+            if entity.name in missing:
+                missing.discard(entity.name)  # dedupe within the batch
+                new_entities.append(entity)
+                rows.append({
+                    "name": entity.name,
+                    "entity_type": entity.entity_type,
+                    "observations": entity.observations
+                })
 
-        with self.driver.session(database=self.database) as session:
-            for entity in entities:
-                # Check if entity already exists
-                result = session.run(
-                    "MATCH (e:Entity {name: $name}) RETURN e",
-                    name=entity.name
-                )
-                if not result.single():
-                    # Create new entity
-                    session.run(
-                        """
-                        CREATE (e:Entity {
-                            name: $name,
-                            entity_type: $entity_type,
-                            observations: $observations
-                        })
-                        """,
-                        name=entity.name,
-                        entity_type=entity.entity_type,
-                        observations=entity.observations
-                    )
-                    new_entities.append(entity)
+        if len(rows) > _BATCH_TX_ROWS:
+            # Very large batches: split into inner transactions so a single
+            # huge commit doesn't hold locks for the whole batch. CALL IN
+            # TRANSACTIONS requires an auto-commit query, hence session.run
+            async with self._session() as session:
+                result = await session.run(_Q_CREATE_ENTITIES_CHUNKED, rows=rows)
+                await result.consume()
+        else:
+            await self.driver.execute_query(
+                _Q_CREATE_ENTITIES,
+                rows=rows,
+                database_=self.database,
+                routing_=RoutingControl.WRITE
+            )
 
+        self._write_seq += 1
         return new_entities
 
+    async def reset_and_create(self, entity_names: List[str], entities: List[Entity]) -> List[Entity]:
+        """Delete the named entities and create the given ones atomically.
+
+        Both statements share one write transaction, so the combined
+        reset pays a single commit. Every created entity's name should be
+        covered by entity_names (or be otherwise absent), as the entities
+        are created unconditionally.
+        """
+        rows = [
+            {
+                "name": entity.name,
+                "entity_type": entity.entity_type,
+                "observations": entity.observations
+            }
+            for entity in entities
+        ]
+
+        async with self._session() as session:
+            await session.execute_write(self._reset_and_create_tx, entity_names, rows)
+        self._write_seq += 1
+        return list(entities)
+
+    @staticmethod
+    async def _reset_and_create_tx(tx: AsyncManagedTransaction, entity_names: List[str],
+                                   rows: List[Dict[str, Any]]) -> None:
+        """Transaction function for reset_and_create."""
+        result = await tx.run(_Q_DELETE_ENTITIES, entity_names=entity_names)
+        await result.consume()
+        result = await tx.run(_Q_CREATE_ENTITIES, rows=rows)
+        await result.consume()
+
     async def create_relations(self, relations: List[Relation]) -> List[Relation]:
         """Create new relations between entities."""
-        new_relations = []
-
-        with self.driver.session(database=self.database) as session:
-            for relation in relations:
-                # Check if relation already exists
-                result = session.run(
-                    """
-                    MATCH (from:Entity {name: $from_name})-[r]-(to:Entity {name: $to_name})
-                    WHERE type(r) = $relation_type
-                    RETURN r
-                    """,
-                    from_name=relation.from_entity,
-                    to_name=relation.to_entity,
-                    relation_type=relation.relation_type.upper().replace(' ', '_')
-                )
-
-                if not result.single():
-                    # Create new relation
-                    session.run(
-                        f"""
-                        MATCH (from:Entity {{name: $from_name}})
-                        MATCH (to:Entity {{name: $to_name}})
-                        CREATE (from)-[r:{relation.relation_type.upper().replace(' ', '_')}]->(to)
-                        """,
-                        from_name=relation.from_entity,
-                        to_name=relation.to_entity
-                    )
-                    new_relations.append(relation)
-
-        return new_relations
+        rows = [
+            {
+                "from": relation.from_entity,
+                "to": relation.to_entity,
+                "rt": _normalize_relation_type(relation.relation_type)
+            }
+            for relation in relations
+        ]
+
+        # apoc.merge.relationship takes the type as a parameter, so all
+        # relations go through one cached query plan regardless of type
+        records, _, _ = await self.driver.execute_query(
+            _Q_MERGE_RELATIONS,
+            rows=rows,
+            database_=self.database,
+            routing_=RoutingControl.WRITE
+        )
+        self._write_seq += 1
+        created_keys = {
+            (record['from_name'], record['to_name'], record['relation_type'])
+            for record in records if record['created']
+        }
+
+        return [
+            relation for relation in relations
+            if (relation.from_entity, relation.to_entity,
+                _normalize_relation_type(relation.relation_type)) in created_keys
+        ]
 
     async def add_observations(self, observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add new observations to existing entities."""
-        results = []
-
-        with self.driver.session(database=self.database) as session:
-            for obs in observations:
-                entity_name = obs['entityName']
-                contents = obs['contents']
-
-                # Get current observations
-                result = session.run(
-                    "MATCH (e:Entity {name: $entity_name}) RETURN e.observations as observations",
-                    entity_name=entity_name
+        items = [
+            {"name": obs['entityName'], "contents": obs['contents']}
+            for obs in observations
+        ]
+
+        async with self._session() as session:
+            if len(items) > _BATCH_TX_ROWS:
+                # CALL IN TRANSACTIONS manages its own commits and can't run
+                # inside a managed transaction, so keep auto-commit here
+                result = await session.run(
+                    _Q_MISSING_ENTITIES,
+                    names=[item['name'] for item in items]
                 )
-                record = result.single()
-
-                if not record:
-                    raise ValueError(f"Entity with name {entity_name} not found")
-
-                current_observations = record['observations'] or []
-                new_observations = [content for content in contents if content not in current_observations]
-
-                if new_observations:
-                    updated_observations = current_observations + new_observations
-                    session.run(
-                        "MATCH (e:Entity {name: $entity_name}) SET e.observations = $observations",
-                        entity_name=entity_name,
-                        observations=updated_observations
-                    )
-
-                results.append({
-                    'entityName': entity_name,
-                    'addedObservations': new_observations
-                })
-
-        return results
+                missing = (await result.single())['missing']
+                if missing:
+                    raise ValueError(f"Entity with name {missing[0]} not found")
+
+                result = await session.run(_Q_ADD_OBSERVATIONS_CHUNKED, items=items)
+                added = [
+                    {'entityName': record['name'], 'addedObservations': record['added']}
+                    async for record in result
+                ]
+            else:
+                # One managed transaction for the existence check and the
+                # update, so the whole batch pays a single commit
+                added = await session.execute_write(self._add_observations_tx, items)
+
+        self._write_seq += 1
+        return added
+
+    @staticmethod
+    async def _add_observations_tx(tx: AsyncManagedTransaction,
+                                   items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Transaction function for add_observations."""
+        # Check all entities exist up front so the error matches the
+        # old per-entity behavior
+        result = await tx.run(
+            _Q_MISSING_ENTITIES,
+            names=[item['name'] for item in items]
+        )
+        missing = (await result.single())['missing']
+        if missing:
+            raise ValueError(f"Entity with name {missing[0]} not found")
+
+        # Compute the set difference server-side and append in one query
+        result = await tx.run(_Q_ADD_OBSERVATIONS, items=items)
+        return [
+            {'entityName': record['name'], 'addedObservations': record['added']}
+            async for record in result
+        ]
 
     async def delete_entities(self, entity_names: List[str]) -> None:
         """Delete entities and their associated relations."""
-        with self.driver.session(database=self.database) as session:
-            session.run(
-                "MATCH (e:Entity) WHERE e.name IN $entity_names DETACH DELETE e",
-                entity_names=entity_names
-            )
+        await self.driver.execute_query(
+            _Q_DELETE_ENTITIES,
+            entity_names=entity_names,
+            database_=self.database,
+            routing_=RoutingControl.WRITE
+        )
+        self._write_seq += 1
 
     async def delete_observations(self, deletions: List[Dict[str, Any]]) -> None:
         """Delete specific observations from entities."""
-        with self.driver.session(database=self.database) as session:
-            for deletion in deletions:
-                entity_name = deletion['entityName']
-                observations_to_delete = deletion['observations']
-
-                # Get current observations
-                result = session.run(
-                    "MATCH (e:Entity {name: $entity_name}) RETURN e.observations as observations",
-                    entity_name=entity_name
-                )
-                record = result.single()
-
-                if record:
-                    current_observations = record['observations'] or []
-                    updated_observations = [obs for obs in current_observations if obs not in observations_to_delete]
-
-                    session.run(
-                        "MATCH (e:Entity {name: $entity_name}) SET e.observations = $observations",
-                        entity_name=entity_name,
-                        observations=updated_observations
-                    )
+        items = [
+            {"name": deletion['entityName'], "obs": deletion['observations']}
+            for deletion in deletions
+        ]
+
+        # Filter the observation lists server-side in a single query
+        await self.driver.execute_query(
+            _Q_DELETE_OBSERVATIONS,
+            items=items,
+            database_=self.database,
+            routing_=RoutingControl.WRITE
+        )
+        self._write_seq += 1
 
     async def delete_relations(self, relations: List[Relation]) -> None:
         """Delete specific relations from the knowledge graph."""
-        with self.driver.session(database=self.database) as session:
-            for relation in relations:
-                session.run(
-                    f"""
-                    MATCH (from:Entity {{name: $from_name}})-[r:{relation.relation_type.upper().replace(' ', '_')}]->(to:Entity {{name: $to_name}})
-                    DELETE r
-                    """,
-                    from_name=relation.from_entity,
-                    to_name=relation.to_entity
-                )
+        rows = [
+            {
+                "from": relation.from_entity,
+                "to": relation.to_entity,
+                "rt": _normalize_relation_type(relation.relation_type)
+            }
+            for relation in relations
+        ]
+
+        # Comparing type(r) against a parameter keeps the query fully
+        # parameterized, so no per-type grouping is needed
+        await self.driver.execute_query(
+            _Q_DELETE_RELATIONS,
+            rows=rows,
+            database_=self.database,
+            routing_=RoutingControl.WRITE
+        )
+        self._write_seq += 1
 
     async def read_graph(self) -> KnowledgeGraph:
-        """Read the entire knowledge graph."""
+        """Read the entire knowledge graph.
+
+        Back-to-back reads with no intervening write through this manager
+        return the memoized KnowledgeGraph. The same instance is handed
+        to every such caller — the dataclasses are frozen but their list
+        fields are not, so treat the returned graph as read-only.
+        """
+        # Snapshot the counter before the awaited query: a write landing
+        # during the await must not get its sequence number attached to
+        # the pre-write snapshot
+        seq = self._write_seq
+        if (self._read_graph_cache is not None
+                and self._read_graph_cache_seq == seq):
+            return self._read_graph_cache
+
         entities = []
         relations = []
 
-        with self.driver.session(database=self.database, fetch_size=10000) as session:
-            # Get all entities
-            result = session.run(
-                "MATCH (e:Entity) RETURN e.name as name, e.entity_type as entity_type, e.observations as observations")
-            for record in result:
-                entities.append(Entity(
-                    name=record['name'],
-                    entity_type=record['entity_type'],
-                    observations=record['observations'] or []
-                ))
-
-            # Get all relations
-            result = session.run(
-                """
-                MATCH (from:Entity)-[r]->(to:Entity)
-                RETURN from.name as from_name, to.name as to_name, type(r) as relation_type
-                """
+        # Collect entities and relations in one round-trip; the filter on
+        # the collected relation maps drops the null row OPTIONAL MATCH
+        # produces on an empty graph
+        records, _, _ = await self.driver.execute_query(
+            _Q_READ_GRAPH,
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        record = records[0]
+        for ent in record['ents']:
+            entities.append(Entity(
+                name=ent['name'],
+                entity_type=ent['entity_type'],
+                observations=ent['observations'] or []
+            ))
+        for rel in record['rels']:
+            relations.append(Relation(
+                from_entity=rel['from_name'],
+                to_entity=rel['to_name'],
+                relation_type=rel['relation_type']
+            ))
+
+        graph = KnowledgeGraph(entities=entities, relations=relations)
+        self._read_graph_cache = graph
+        self._read_graph_cache_seq = seq
+        return graph
+
+    async def read_graph_raw(self) -> Dict[str, Any]:
+        """Read the entire knowledge graph as JSON-shaped dicts.
+
+        Skips the dataclass round-trip for callers that only serialize
+        the result; the keys are shaped in the Cypher projection.
+        """
+        records, _, _ = await self.driver.execute_query(
+            _Q_READ_GRAPH_RAW,
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        record = records[0]
+        return {"entities": record['ents'], "relations": record['rels']}
+
+    async def _search_records(self, query: str, fulltext_query: str,
+                              substring_query: str) -> Dict[str, Any]:
+        """Run the substring and full-text searches and union the results.
+
+        The substring scan over the precomputed lowercase properties
+        carries the baseline semantics (any substring hit matches); the
+        full-text index widens multi-term queries to per-term matches.
+        Lucene input is escaped so punctuation is matched literally, and
+        queries it still cannot parse (e.g. a bare AND) just contribute
+        nothing rather than erroring the whole search.
+        """
+        records, _, _ = await self.driver.execute_query(
+            substring_query,
+            search_query_lc=query.lower(),
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        record = records[0]
+        ents = list(record['ents'])
+        rels = list(record['rels'])
+
+        ft_ents: List[Dict[str, Any]] = []
+        ft_rels: List[Dict[str, Any]] = []
+        try:
+            records, _, _ = await self.driver.execute_query(
+                fulltext_query,
+                search_query=_escape_lucene_query(query),
+                database_=self.database,
+                routing_=RoutingControl.READ
             )
-            for record in result:
-                relations.append(Relation(
-                    from_entity=record['from_name'],
-                    to_entity=record['to_name'],
-                    relation_type=record['relation_type'].replace('_', ' ').lower()
-                ))
-
-        return KnowledgeGraph(entities=entities, relations=relations)
+            ft_ents = list(records[0]['ents'])
+            ft_rels = list(records[0]['rels'])
+        except ClientError:
+            pass  # Unparseable even after escaping; substring results stand
+
+        seen_ents = {ent['name'] for ent in ents}
+        ents += [ent for ent in ft_ents if ent['name'] not in seen_ents]
+        seen_rels = {tuple(sorted(rel.items())) for rel in rels}
+        rels += [rel for rel in ft_rels
+                 if tuple(sorted(rel.items())) not in seen_rels]
+        return {'ents': ents, 'rels': rels}
 
     async def search_nodes(self, query: str) -> KnowledgeGraph:
         """Search for nodes based on a query string."""
         entities = []
         relations = []
 
-        with self.driver.session(database=self.database) as session:
-            # Search entities by name, type, or observations
-            result = session.run(
-                """
-                MATCH (e:Entity)
-                WHERE toLower(e.name) CONTAINS toLower($search_query)
-                   OR toLower(e.entity_type) CONTAINS toLower($search_query)
-                   OR any(obs IN e.observations WHERE toLower(obs) CONTAINS toLower($search_query))
-                RETURN e.name as name, e.entity_type as entity_type, e.observations as observations
-                """,
-                search_query=query
-            )
-
-            entity_names = set()
-            for record in result:
-                entities.append(Entity(
-                    name=record['name'],
-                    entity_type=record['entity_type'],
-                    observations=record['observations'] or []
-                ))
-                entity_names.add(record['name'])
-
-            # Get relations between filtered entities
-            if entity_names:
-                result = session.run(
-                    """
-                    MATCH (from:Entity)-[r]->(to:Entity)
-                    WHERE from.name IN $entity_names AND to.name IN $entity_names
-                    RETURN from.name as from_name, to.name as to_name, type(r) as relation_type
-                    """,
-                    entity_names=list(entity_names)
-                )
-                for record in result:
-                    relations.append(Relation(
-                        from_entity=record['from_name'],
-                        to_entity=record['to_name'],
-                        relation_type=record['relation_type'].replace('_', ' ').lower()
-                    ))
+        record = await self._search_records(
+            query, _Q_SEARCH_NODES, _Q_SEARCH_NODES_SUBSTRING)
+        for ent in record['ents']:
+            entities.append(Entity(
+                name=ent['name'],
+                entity_type=ent['entity_type'],
+                observations=ent['observations'] or []
+            ))
+        for rel in record['rels']:
+            relations.append(Relation(
+                from_entity=rel['from_name'],
+                to_entity=rel['to_name'],
+                relation_type=rel['relation_type']
+            ))
 
         return KnowledgeGraph(entities=entities, relations=relations)
 
+    async def search_nodes_raw(self, query: str) -> Dict[str, Any]:
+        """Search for nodes, returning JSON-shaped dicts (see read_graph_raw)."""
+        record = await self._search_records(
+            query, _Q_SEARCH_NODES_RAW, _Q_SEARCH_NODES_SUBSTRING_RAW)
+        return {"entities": record['ents'], "relations": record['rels']}
+
     async def open_nodes(self, names: List[str]) -> KnowledgeGraph:
         """Open specific nodes by their names."""
         entities = []
         relations = []
 
-        with self.driver.session(database=self.database) as session:
-            # Get specified entities
-            result = session.run(
-                "MATCH (e:Entity) WHERE e.name IN $entity_names RETURN e.name as name, e.entity_type as entity_type, e.observations as observations",
-                entity_names=names
-            )
-
-            found_names = set()
-            for record in result:
-                entities.append(Entity(
-                    name=record['name'],
-                    entity_type=record['entity_type'],
-                    observations=record['observations'] or []
-                ))
-                found_names.add(record['name'])
-
-            # Get relations between specified entities
-            if found_names:
-                result = session.run(
-                    """
-                    MATCH (from:Entity)-[r]->(to:Entity)
-                    WHERE from.name IN $entity_names AND to.name IN $entity_names
-                    RETURN from.name as from_name, to.name as to_name, type(r) as relation_type
-                    """,
-                    entity_names=list(found_names)
-                )
-                for record in result:
-                    relations.append(Relation(
-                        from_entity=record['from_name'],
-                        to_entity=record['to_name'],
-                        relation_type=record['relation_type'].replace('_', ' ').lower()
-                    ))
+        # Get the requested entities and the relations between them in a
+        # single round-trip
+        records, _, _ = await self.driver.execute_query(
+            _Q_OPEN_NODES,
+            entity_names=names,
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        record = records[0]
+        for ent in record['ents']:
+            entities.append(Entity(
+                name=ent['name'],
+                entity_type=ent['entity_type'],
+                observations=ent['observations'] or []
+            ))
+        for rel in record['rels']:
+            relations.append(Relation(
+                from_entity=rel['from_name'],
+                to_entity=rel['to_name'],
+                relation_type=rel['relation_type']
+            ))
 
         return KnowledgeGraph(entities=entities, relations=relations)
+
+    async def open_nodes_raw(self, names: List[str]) -> Dict[str, Any]:
+        """Open specific nodes, returning JSON-shaped dicts (see read_graph_raw)."""
+        records, _, _ = await self.driver.execute_query(
+            _Q_OPEN_NODES_RAW,
+            entity_names=names,
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        record = records[0]
+        return {"entities": record['ents'], "relations": record['rels']}
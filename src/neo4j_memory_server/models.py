@@ -1,21 +1,21 @@
 from typing import List
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Entity:
     name: str
     entity_type: str
     observations: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Relation:
     from_entity: str
     to_entity: str
     relation_type: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KnowledgeGraph:
     entities: List[Entity]
     relations: List[Relation]
@@ -1,29 +1,38 @@
 import asyncio
-import json
 import sys
 from typing import Any, Dict, List
 
 import mcp.server.stdio
 import mcp.types as types
+import orjson
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from neo4j_memory_server.config import NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD, NEO4J_DATABASE
+from neo4j_memory_server.config import (
+    NEO4J_URI,
+    NEO4J_USERNAME,
+    NEO4J_PASSWORD,
+    NEO4J_DATABASE,
+    NEO4J_MAX_CONNECTION_POOL_SIZE,
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+    NEO4J_CONNECTION_TIMEOUT,
+)
 from neo4j_memory_server.manager import Neo4jKnowledgeGraphManager
 from neo4j_memory_server.models import Entity, Relation
 
-# Initialize the knowledge graph manager
-knowledge_graph_manager = Neo4jKnowledgeGraphManager(
-    uri=NEO4J_URI,
-    username=NEO4J_USERNAME,
-    password=NEO4J_PASSWORD,
-    database=NEO4J_DATABASE
-)
+# The knowledge graph manager; None only until main() assigns it, before
+# any tool call can arrive
+knowledge_graph_manager: Neo4jKnowledgeGraphManager | None = None
 
 # Create the MCP server
 server = Server("neo4j-memory-server")
 
 
+def _to_json(obj: Any) -> str:
+    """Serialize a tool result to pretty-printed JSON via orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 @server.list_tools()
 async def handle_list_tools() -> List[types.Tool]:
     """List available tools."""
@@ -211,6 +220,10 @@ async def handle_list_tools() -> List[types.Tool]:
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls."""
+    # main() assigns the manager before the server starts serving, so
+    # this only trips on a wiring bug — and narrows the Optional for mypy
+    assert knowledge_graph_manager is not None
+
     try:
         if name == "create_entities":
             entities = [
@@ -224,11 +237,11 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             result = await knowledge_graph_manager.create_entities(entities)
             return [types.TextContent(
                 type="text",
-                text=json.dumps([{
+                text=_to_json([{
                     "name": e.name,
                     "entityType": e.entity_type,
                     "observations": e.observations
-                } for e in result], indent=2)
+                } for e in result])
             )]
 
         elif name == "create_relations":
@@ -243,16 +256,16 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             result = await knowledge_graph_manager.create_relations(relations)
             return [types.TextContent(
                 type="text",
-                text=json.dumps([{
+                text=_to_json([{
                     "from": r.from_entity,
                     "to": r.to_entity,
                     "relationType": r.relation_type
-                } for r in result], indent=2)
+                } for r in result])
             )]
 
         elif name == "add_observations":
             result = await knowledge_graph_manager.add_observations(arguments["observations"])
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+            return [types.TextContent(type="text", text=_to_json(result))]
 
         elif name == "delete_entities":
             await knowledge_graph_manager.delete_entities(arguments["entityNames"])
@@ -275,58 +288,16 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             return [types.TextContent(type="text", text="Relations deleted successfully")]
 
         elif name == "read_graph":
-            result = await knowledge_graph_manager.read_graph()
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "entities": [{
-                        "name": e.name,
-                        "entityType": e.entity_type,
-                        "observations": e.observations
-                    } for e in result.entities],
-                    "relations": [{
-                        "from": r.from_entity,
-                        "to": r.to_entity,
-                        "relationType": r.relation_type
-                    } for r in result.relations]
-                }, indent=2)
-            )]
+            result = await knowledge_graph_manager.read_graph_raw()
+            return [types.TextContent(type="text", text=_to_json(result))]
 
         elif name == "search_nodes":
-            result = await knowledge_graph_manager.search_nodes(arguments["query"])
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "entities": [{
-                        "name": e.name,
-                        "entityType": e.entity_type,
-                        "observations": e.observations
-                    } for e in result.entities],
-                    "relations": [{
-                        "from": r.from_entity,
-                        "to": r.to_entity,
-                        "relationType": r.relation_type
-                    } for r in result.relations]
-                }, indent=2)
-            )]
+            result = await knowledge_graph_manager.search_nodes_raw(arguments["query"])
+            return [types.TextContent(type="text", text=_to_json(result))]
 
         elif name == "open_nodes":
-            result = await knowledge_graph_manager.open_nodes(arguments["names"])
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "entities": [{
-                        "name": e.name,
-                        "entityType": e.entity_type,
-                        "observations": e.observations
-                    } for e in result.entities],
-                    "relations": [{
-                        "from": r.from_entity,
-                        "to": r.to_entity,
-                        "relationType": r.relation_type
-                    } for r in result.relations]
-                }, indent=2)
-            )]
+            result = await knowledge_graph_manager.open_nodes_raw(arguments["names"])
+            return [types.TextContent(type="text", text=_to_json(result))]
 
         else:
             raise ValueError(f"Unknown tool: {name}")
@@ -340,19 +311,33 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
 
 async def main():
     """Main entry point for the server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="neo4j-memory-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    global knowledge_graph_manager
+    knowledge_graph_manager = await Neo4jKnowledgeGraphManager.create(
+        uri=NEO4J_URI,
+        username=NEO4J_USERNAME,
+        password=NEO4J_PASSWORD,
+        database=NEO4J_DATABASE,
+        max_connection_pool_size=NEO4J_MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        connection_timeout=NEO4J_CONNECTION_TIMEOUT,
+    )
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="neo4j-memory-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await knowledge_graph_manager.close()
 
 
 if __name__ == "__main__":
@@ -363,5 +348,3 @@ if __name__ == "__main__":
     except Exception as error:
         print(f"Fatal error in main(): {error}", file=sys.stderr)
         sys.exit(1)
-    finally:
-        knowledge_graph_manager.close()
@@ -1,49 +1,86 @@
 import asyncio
-import json
+import logging
 import os
+import sys
+
+import orjson
+import pytest
+import pytest_asyncio
+from neo4j import AsyncGraphDatabase, basic_auth
 
 from neo4j_memory_server.manager import Neo4jKnowledgeGraphManager
 from neo4j_memory_server.models import Relation, Entity
 
+log = logging.getLogger(__name__)
+
+# Read the connection settings out of the environment once; the module
+# vars and the __main__ missing-variable check all derive from this
+_ENV = {
+    k: os.environ.get(k)
+    for k in ("NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD", "NEO4J_DATABASE")
+}
+_NEO4J_URI = _ENV["NEO4J_URI"] or "bolt://localhost:7687"
+_NEO4J_USERNAME = _ENV["NEO4J_USERNAME"] or "neo4j"
+_NEO4J_PASSWORD = _ENV["NEO4J_PASSWORD"]
+_NEO4J_DATABASE = _ENV["NEO4J_DATABASE"]
+
+_BANNER = "=" * 50
+
+# One driver (and connection pool) shared by every test coroutine;
+# construction is lazy, so no connection happens until first use
+_DRIVER = AsyncGraphDatabase.driver(
+    _NEO4J_URI,
+    auth=basic_auth(_NEO4J_USERNAME, _NEO4J_PASSWORD),
+    max_connection_pool_size=50,
+)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def manager():
+    """Session-scoped manager so the suite shares one driver/pool."""
+    try:
+        await _DRIVER.verify_connectivity()
+    except Exception as e:
+        pytest.skip(f"Neo4j server not available: {e}")
 
-async def test_neo4j_memory_server():
-    """Test the Neo4j Memory Server functionality."""
-
-    # Initialize the manager
-    neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    neo4j_username = os.getenv("NEO4J_USERNAME", "neo4j")
-    neo4j_password = os.getenv("NEO4J_PASSWORD")
-    neo4j_database = os.getenv("NEO4J_DATABASE")
-
-    manager = Neo4jKnowledgeGraphManager(
-        uri=neo4j_uri,
-        username=neo4j_username,
-        password=neo4j_password,
-        database=neo4j_database
+    m = await Neo4jKnowledgeGraphManager.create(
+        database=_NEO4J_DATABASE,
+        driver=_DRIVER
     )
+    yield m
+    await _DRIVER.close()
 
-    try:
-        print("🧪 Testing Neo4j Memory Server...")
 
-        # Clear any existing test data
-        print("\n1. Clearing test data...")
-        await manager.delete_entities(["Alice", "Bob", "Acme Corp", "TechCorp"])
+async def test_neo4j_memory_server(manager):
+    """Test the Neo4j Memory Server functionality."""
 
-        # Test 1: Create entities
-        print("\n2. Creating entities...")
+    passed = False
+    try:
+        log.info("🧪 Testing Neo4j Memory Server...")
+
+        # Test 1: Clear any existing test data and create entities in one
+        # transaction; the pre-clean is skippable when the database is
+        # known to be empty (e.g. a freshly started server in CI)
+        log.info("\n1. Clearing test data...")
+        log.info("\n2. Creating entities...")
         entities = [
             Entity(name="Alice", entity_type="Person", observations=["Software Engineer", "Lives in San Francisco"]),
             Entity(name="Bob", entity_type="Person", observations=["Product Manager", "Likes coffee"]),
             Entity(name="Acme Corp", entity_type="Company", observations=["Tech company", "Founded in 2020"]),
         ]
 
-        created_entities = await manager.create_entities(entities)
-        print(f"   ✅ Created {len(created_entities)} entities")
-        for entity in created_entities:
-            print(f"      - {entity.name} ({entity.entity_type})")
+        if os.getenv("SKIP_PRECLEAN"):
+            created_entities = await manager.create_entities(entities)
+        else:
+            created_entities = await manager.reset_and_create(
+                ["Alice", "Bob", "Acme Corp", "TechCorp"], entities)
+        log.info("   ✅ Created %d entities", len(created_entities))
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"      - {e.name} ({e.entity_type})\n" for e in created_entities))
 
         # Test 2: Create relations
-        print("\n3. Creating relations...")
+        log.info("\n3. Creating relations...")
         relations = [
             Relation(from_entity="Alice", to_entity="Acme Corp", relation_type="works at"),
             Relation(from_entity="Bob", to_entity="Acme Corp", relation_type="works at"),
@@ -51,85 +88,98 @@ async def test_neo4j_memory_server():
         ]
 
         created_relations = await manager.create_relations(relations)
-        print(f"   ✅ Created {len(created_relations)} relations")
-        for relation in created_relations:
-            print(f"      - {relation.from_entity} {relation.relation_type} {relation.to_entity}")
+        log.info("   ✅ Created %d relations", len(created_relations))
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"      - {r.from_entity} {r.relation_type} {r.to_entity}\n" for r in created_relations))
 
         # Test 3: Add observations
-        print("\n4. Adding observations...")
+        log.info("\n4. Adding observations...")
         observations = [
             {"entityName": "Alice", "contents": ["Python expert", "Team lead"]},
             {"entityName": "Acme Corp", "contents": ["Growing rapidly", "Remote-first"]}
         ]
 
         added_obs = await manager.add_observations(observations)
-        print("   ✅ Added observations")
-        for result in added_obs:
-            print(f"      - {result['entityName']}: {result['addedObservations']}")
-
-        # Test 4: Read entire graph
-        print("\n5. Reading entire graph...")
-        graph = await manager.read_graph()
-        print(f"   ✅ Graph contains {len(graph.entities)} entities and {len(graph.relations)} relations")
-
-        # Test 5: Search nodes
-        print("\n6. Searching for 'engineer'...")
-        search_result = await manager.search_nodes("engineer")
-        print(f"   ✅ Found {len(search_result.entities)} entities matching 'engineer'")
-        for entity in search_result.entities:
-            print(f"      - {entity.name}: {entity.observations}")
-
-        # Test 6: Open specific nodes
-        print("\n7. Opening specific nodes...")
-        specific_nodes = await manager.open_nodes(["Alice", "Bob"])
-        print(f"   ✅ Retrieved {len(specific_nodes.entities)} specific entities")
-        print(f"   ✅ Found {len(specific_nodes.relations)} relations between them")
+        log.info("   ✅ Added observations")
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"      - {r['entityName']}: {r['addedObservations']}\n" for r in added_obs))
+
+        # Tests 4-6: the three reads are independent, so fan them out and
+        # let the driver overlap the round-trips on its connection pool
+        log.info("\n5. Reading entire graph...")
+        log.info("\n6. Searching for 'engineer'...")
+        log.info("\n7. Opening specific nodes...")
+        graph, search_result, specific_nodes = await asyncio.gather(
+            manager.read_graph(),
+            manager.search_nodes("engineer"),
+            manager.open_nodes(["Alice", "Bob"])
+        )
+        log.info("   ✅ Graph contains %d entities and %d relations", len(graph.entities), len(graph.relations))
+        log.info("   ✅ Found %d entities matching 'engineer'", len(search_result.entities))
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"      - {e.name}: {e.observations}\n" for e in search_result.entities))
+        log.info("   ✅ Retrieved %d specific entities", len(specific_nodes.entities))
+        log.info("   ✅ Found %d relations between them", len(specific_nodes.relations))
 
         # Test 7: Delete observations
-        print("\n8. Deleting observations...")
+        log.info("\n8. Deleting observations...")
         deletions = [
             {"entityName": "Alice", "observations": ["Python expert"]}
         ]
         await manager.delete_observations(deletions)
-        print("   ✅ Deleted specific observations")
+        log.info("   ✅ Deleted specific observations")
 
         # Test 8: Delete relations
-        print("\n9. Deleting relations...")
+        log.info("\n9. Deleting relations...")
         relations_to_delete = [
             Relation(from_entity="Alice", to_entity="Bob", relation_type="collaborates with")
         ]
         await manager.delete_relations(relations_to_delete)
-        print("   ✅ Deleted specific relations")
+        log.info("   ✅ Deleted specific relations")
 
         # Test 9: Verify final state
-        print("\n10. Final verification...")
+        log.info("\n10. Final verification...")
         final_graph = await manager.read_graph()
-        print(f"   ✅ Final state: {len(final_graph.entities)} entities, {len(final_graph.relations)} relations")
+        log.info("   ✅ Final state: %d entities, %d relations", len(final_graph.entities), len(final_graph.relations))
 
         # Display final graph
-        print("\n📊 Final Graph State:")
-        print("Entities:")
-        for entity in final_graph.entities:
-            print(f"  - {entity.name} ({entity.entity_type}): {entity.observations}")
+        log.info("\n📊 Final Graph State:")
+        log.info("Entities:")
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"  - {e.name} ({e.entity_type}): {e.observations}\n" for e in final_graph.entities))
 
-        print("Relations:")
-        for relation in final_graph.relations:
-            print(f"  - {relation.from_entity} → {relation.relation_type} → {relation.to_entity}")
+        log.info("Relations:")
+        if log.isEnabledFor(logging.INFO):
+            sys.stdout.write("".join(
+                f"  - {r.from_entity} → {r.relation_type} → {r.to_entity}\n" for r in final_graph.relations))
 
-        print("\n🎉 All tests passed!")
+        log.info("\n🎉 All tests passed!")
+        passed = True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        log.error("❌ Test failed: %s", e)
         raise
     finally:
-        # Clean up
-        await manager.delete_entities(["Alice", "Bob", "Acme Corp", "TechCorp"])
-        manager.close()
+        # Clean up off the critical path; on failure the exception
+        # surfaces immediately instead of waiting on a delete round-trip.
+        # The shared driver is closed in _main() after the loop drains.
+        cleanup = asyncio.create_task(
+            manager.delete_entities(["Alice", "Bob", "Acme Corp", "TechCorp"]))
+        if passed:
+            await asyncio.wait_for(asyncio.shield(cleanup), timeout=5)
+        else:
+            # Let the scheduled cleanup run in the background; swallow its
+            # outcome so it never masks the original failure
+            cleanup.add_done_callback(lambda t: t.cancelled() or t.exception())
 
 
 async def test_mcp_json_format():
     """Test with MCP-style JSON format."""
-    print("\n🔧 Testing MCP JSON format...")
+    log.info("\n🔧 Testing MCP JSON format...")
 
     # Sample data in MCP format
     mcp_entities = [
@@ -148,18 +198,44 @@ async def test_mcp_json_format():
         }
     ]
 
-    print("✅ MCP format validation passed")
-    print(f"   Entities: {json.dumps(mcp_entities, indent=2)}")
-    print(f"   Relations: {json.dumps(mcp_relations, indent=2)}")
+    # orjson serializes compactly by default; pretty-print only when
+    # explicitly asked for
+    if os.getenv("VERBOSE"):
+        entities_json = orjson.dumps(mcp_entities, option=orjson.OPT_INDENT_2).decode()
+        relations_json = orjson.dumps(mcp_relations, option=orjson.OPT_INDENT_2).decode()
+    else:
+        entities_json = orjson.dumps(mcp_entities).decode()
+        relations_json = orjson.dumps(mcp_relations).decode()
+
+    log.info("✅ MCP format validation passed")
+    log.info("   Entities: %s", entities_json)
+    log.info("   Relations: %s", relations_json)
+
+
+async def _main():
+    """Run all tests on a single event loop, then close the shared driver."""
+    try:
+        m = await Neo4jKnowledgeGraphManager.create(
+            database=_NEO4J_DATABASE,
+            driver=_DRIVER
+        )
+        # The JSON format test is pure CPU, so it runs while the Neo4j
+        # test awaits the network
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(test_neo4j_memory_server(m))
+            tg.create_task(test_mcp_json_format())
+    finally:
+        await _DRIVER.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout, format="%(message)s")
+
     print("🚀 Starting Neo4j Memory Server Tests")
-    print("=" * 50)
+    print(_BANNER)
 
-    # Check environment variables
-    required_vars = ["NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    # Check environment variables (NEO4J_DATABASE is optional)
+    missing_vars = [k for k, v in _ENV.items() if v is None and k != "NEO4J_DATABASE"]
 
     if missing_vars:
         print(f"⚠️  Warning: Missing environment variables: {missing_vars}")
@@ -173,9 +249,9 @@ if __name__ == "__main__":
                 print(f"   export {var}=your_password_here")
 
     try:
-        # Run async tests
-        asyncio.run(test_neo4j_memory_server())
-        asyncio.run(test_mcp_json_format())
+        # Run async tests on one event loop so the shared driver's
+        # connection pool survives across both
+        asyncio.run(_main())
 
     except Exception as e:
         print(f"\n💥 Test suite failed: {e}")